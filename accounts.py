@@ -1,14 +1,17 @@
 import os
 import pickle
-import json
-import base64
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+try:
+    import pybase64 as base64  # SIMD accelerated, same API as the stdlib module
+except ImportError:
+    import base64
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-                            QListWidget, QInputDialog, QMessageBox, QLineEdit, QListWidgetItem,
-                            QGroupBox)
-from PyQt5.QtCore import Qt, pyqtSignal
-import google_auth_oauthlib.flow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+                            QListWidget, QInputDialog, QMessageBox, QLineEdit,
+                            QGroupBox, QListView)
+from PyQt5.QtCore import pyqtSignal, QTimer, QCoreApplication, QThread
+# The Google client libraries are imported where they are used, they are slow to import
 
 # Constants
 SCOPES = [
@@ -17,6 +20,31 @@ SCOPES = [
 ]
 API_SERVICE_NAME = 'youtube'
 API_VERSION = 'v3'
+SAVE_DELAY_MS = 250  # Coalesce bursts of account changes into one write
+CHANNEL_REFRESH_WORKERS = 8
+IO_BUFFER_SIZE = 1 << 20  # Read and write the accounts file in as few syscalls as possible
+
+# Prefer orjson for the accounts file, then ujson, then the stdlib encoder
+try:
+    import orjson
+    _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        _dumps = lambda obj: ujson.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+        _loads = ujson.loads
+    except ImportError:
+        import json
+        _dumps = lambda obj: json.dumps(obj, indent=2).encode('utf-8')
+        _loads = json.loads
+
+# Large accounts files are parsed incrementally when ijson is installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+STREAM_LOAD_THRESHOLD = 4 << 20  # 4 MiB
 
 class AccountManager:
     """Class to manage multiple Google accounts, each representing a YouTube channel"""
@@ -27,6 +55,20 @@ class AccountManager:
         self.accounts = {}
         self.current_account = None
         self.logger = logger
+        # name -> deserialized Credentials, filled on first use
+        self._cred_cache = {}
+        # Accounts whose cached credentials were refreshed and still need serializing
+        self._stale_credentials = set()
+        # Guards accounts, the credential caches and the dirty flag, credentials are
+        # also resolved (and refreshed) from the bulk worker thread
+        self._lock = threading.RLock()
+        # id(credentials) -> (credentials, YouTube service built for them)
+        self._service_cache = {}
+        # Set whenever in-memory state diverges from the accounts file
+        self._dirty = False
+        self._save_pending = False
+        # Digest of the bytes last read from or written to the accounts file
+        self._last_saved_hash = None
         self.load_accounts()
     
     def log(self, message, level="info"):
@@ -43,54 +85,127 @@ class AccountManager:
         """Load saved accounts from file"""
         if os.path.exists(self.accounts_file):
             try:
-                with open(self.accounts_file, 'r') as f:
-                    data = json.load(f)
-                    # Convert base64 string back to credentials bytes
+                accounts_data = {}
+                
+                if ijson is not None and os.path.getsize(self.accounts_file) > STREAM_LOAD_THRESHOLD:
+                    # Parse one account at a time instead of materializing the whole document
+                    self._last_saved_hash = None
+                    with open(self.accounts_file, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                        for name, account_info in ijson.kvitems(f, 'accounts', use_float=True,
+                                                                buf_size=IO_BUFFER_SIZE):
+                            accounts_data[name] = account_info
+                        f.seek(0)
+                        current_account = next(ijson.items(f, 'current_account', buf_size=IO_BUFFER_SIZE), None)
+                else:
+                    with open(self.accounts_file, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                        raw = f.read()
+                    self._last_saved_hash = hashlib.blake2b(raw, digest_size=16).digest()
+                    data = _loads(raw)
                     accounts_data = data.get('accounts', {})
-                    for name, account_info in accounts_data.items():
-                        if 'credentials' in account_info:
-                            try:
-                                # Decode the base64 string to bytes
-                                creds_bytes = base64.b64decode(account_info['credentials'])
-                                # Store the bytes directly
-                                account_info['credentials'] = creds_bytes
-                            except:
-                                self.log(f"Failed to decode credentials for account {name}", "error")
-                    
-                    self.accounts = accounts_data
-                    self.current_account = data.get('current_account')
+                    current_account = data.get('current_account')
+                
+                self.accounts = accounts_data
+                self.current_account = current_account
                 self.log(f"Loaded {len(self.accounts)} accounts")
             except Exception as e:
                 self.log(f"Error loading accounts: {str(e)}", "error")
                 self.accounts = {}
                 self.current_account = None
     
+    def _migrate_credentials(self, name):
+        """Convert credentials stored as a base64 encoded pickle to JSON, returns the credentials"""
+        account_info = self.accounts[name]
+        credentials = pickle.loads(base64.b64decode(account_info['credentials']))
+        account_info['credentials'] = _loads(credentials.to_json())
+        self._mark_dirty()
+        self.log(f"Converted stored credentials for {name}")
+        return credentials
+    
     def save_accounts(self):
         """Save accounts to file"""
+        if not self._dirty:
+            return True
+        
         try:
-            # Create a copy of accounts to modify for JSON serialization
-            serializable_accounts = {}
-            for name, account_info in self.accounts.items():
-                serializable_account = account_info.copy()
-                if 'credentials' in serializable_account:
-                    # Convert credentials bytes to base64 encoded string for JSON serialization
-                    credentials_bytes = serializable_account['credentials']
-                    serializable_account['credentials'] = base64.b64encode(credentials_bytes).decode('utf-8')
-                serializable_accounts[name] = serializable_account
+            # Snapshot the state under the lock, changes made by other threads
+            # after this mark it dirty again for the next save
+            with self._lock:
+                # Serialize credentials refreshed since the last save
+                for name in self._stale_credentials:
+                    if name in self.accounts and name in self._cred_cache:
+                        self.accounts[name]['credentials'] = _loads(self._cred_cache[name].to_json())
+                self._stale_credentials.clear()
+                
+                # Credentials are stored as plain JSON dicts, so accounts serialize as-is
+                data = {
+                    'accounts': self.accounts,
+                    'current_account': self.current_account
+                }
+                
+                # Serialize in memory first so the file gets a single write
+                serialized = _dumps(data)
+                self._dirty = False
             
-            data = {
-                'accounts': serializable_accounts,
-                'current_account': self.current_account
-            }
+            # Changes that cancel out leave the file as it is
+            digest = hashlib.blake2b(serialized, digest_size=16).digest()
+            if digest == self._last_saved_hash:
+                return True
             
-            with open(self.accounts_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Write to a temporary file so a crash never leaves a truncated accounts file
+            tmp_file = self.accounts_file + '.tmp'
+            with open(tmp_file, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                f.write(serialized)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.accounts_file)
+            self._last_saved_hash = digest
             self.log(f"Saved {len(self.accounts)} accounts")
             return True
         except Exception as e:
+            self._dirty = True
             self.log(f"Error saving accounts: {str(e)}", "error")
             return False
     
+    def _mark_dirty(self):
+        """Record that in-memory state changed and schedule a save"""
+        self._dirty = True
+        self.request_save()
+    
+    def request_save(self):
+        """Schedule a save, merging requests that arrive within SAVE_DELAY_MS"""
+        if self._save_pending or not self._dirty:
+            return
+        
+        # Without a Qt application there is no event loop to run the timer
+        app = QCoreApplication.instance()
+        if app is None:
+            self.save_accounts()
+            return
+        # The timer only fires on the GUI thread, changes made from worker
+        # threads stay dirty until the next request there or flush()
+        if QThread.currentThread() is not app.thread():
+            return
+        
+        self._save_pending = True
+        QTimer.singleShot(SAVE_DELAY_MS, self.flush)
+    
+    def flush(self):
+        """Write pending changes to disk immediately"""
+        self._save_pending = False
+        return self.save_accounts()
+    
+    def _get_service(self, credentials):
+        """Return a YouTube service for credentials, building it only once per credentials object"""
+        cached = self._service_cache.get(id(credentials))
+        if cached is not None and cached[0] is credentials:
+            return cached[1]
+        
+        from googleapiclient.discovery import build
+        youtube = build(API_SERVICE_NAME, API_VERSION, credentials=credentials,
+                        cache_discovery=False, static_discovery=True)
+        self._service_cache[id(credentials)] = (credentials, youtube)
+        return youtube
+    
     def set_client_secrets_file(self, path):
         """Set the client secrets file path"""
         self.client_secrets_file = path
@@ -109,12 +224,13 @@ class AccountManager:
                 return False
             
             try:
+                import google_auth_oauthlib.flow
                 flow = google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file(
                     self.client_secrets_file, SCOPES)
                 credentials = flow.run_local_server(port=8080)
                 
                 # Test the credentials by getting user info
-                youtube = build(API_SERVICE_NAME, API_VERSION, credentials=credentials)
+                youtube = self._get_service(credentials)
                 response = youtube.channels().list(part="snippet", mine=True).execute()
                 
                 if not response.get('items'):
@@ -125,19 +241,17 @@ class AccountManager:
                 channel_id = response['items'][0]['id']
                 channel_title = response['items'][0]['snippet']['title']
                 
-                # Serialize credentials to bytes
-                credentials_bytes = pickle.dumps(credentials)
-                
                 # Store account with channel info directly
                 self.accounts[name] = {
-                    'credentials': credentials_bytes,
+                    'credentials': _loads(credentials.to_json()),
                     'display_name': name,
                     'channel_id': channel_id,
                     'channel_title': channel_title
                 }
+                self._cred_cache[name] = credentials
                 
                 self.current_account = name
-                self.save_accounts()
+                self._mark_dirty()
                 self.log(f"Added new account: {name} for channel: {channel_title}")
                 return True
                 
@@ -147,10 +261,8 @@ class AccountManager:
         else:
             # Add with provided credentials
             try:
-                credentials_bytes = pickle.dumps(credentials)
-                
                 # Try to get channel info
-                youtube = build(API_SERVICE_NAME, API_VERSION, credentials=credentials)
+                youtube = self._get_service(credentials)
                 response = youtube.channels().list(part="snippet", mine=True).execute()
                 
                 if response.get('items'):
@@ -161,12 +273,13 @@ class AccountManager:
                     channel_title = "Unknown Channel"
                 
                 self.accounts[name] = {
-                    'credentials': credentials_bytes,
+                    'credentials': _loads(credentials.to_json()),
                     'display_name': name,
                     'channel_id': channel_id,
                     'channel_title': channel_title
                 }
-                self.save_accounts()
+                self._cred_cache[name] = credentials
+                self._mark_dirty()
                 return True
             except Exception as e:
                 self.log(f"Error adding account with provided credentials: {str(e)}", "error")
@@ -182,14 +295,21 @@ class AccountManager:
             self.log(f"Account {new_name} already exists", "error")
             return False
         
-        self.accounts[new_name] = self.accounts[old_name]
-        self.accounts[new_name]['display_name'] = new_name
-        del self.accounts[old_name]
+        with self._lock:
+            entry = self.accounts.pop(old_name)
+            entry['display_name'] = new_name
+            self.accounts[new_name] = entry
+            cached_credentials = self._cred_cache.pop(old_name, None)
+            if cached_credentials is not None:
+                self._cred_cache[new_name] = cached_credentials
+            if old_name in self._stale_credentials:
+                self._stale_credentials.discard(old_name)
+                self._stale_credentials.add(new_name)
         
         if self.current_account == old_name:
             self.current_account = new_name
             
-        self.save_accounts()
+        self._mark_dirty()
         self.log(f"Renamed account {old_name} to {new_name}")
         return True
     
@@ -199,12 +319,17 @@ class AccountManager:
             self.log(f"Account {name} not found", "error")
             return False
         
-        del self.accounts[name]
+        with self._lock:
+            del self.accounts[name]
+            credentials = self._cred_cache.pop(name, None)
+            if credentials is not None:
+                self._service_cache.pop(id(credentials), None)
+            self._stale_credentials.discard(name)
         
         if self.current_account == name:
             self.current_account = None if not self.accounts else list(self.accounts.keys())[0]
             
-        self.save_accounts()
+        self._mark_dirty()
         self.log(f"Removed account: {name}")
         return True
     
@@ -214,7 +339,9 @@ class AccountManager:
             self.log(f"Account {name} not found", "error")
             return False
         
-        self.current_account = name
+        if self.current_account != name:
+            self.current_account = name
+            self._dirty = True
         self.log(f"Selected account: {name}")
         return True
     
@@ -227,22 +354,51 @@ class AccountManager:
             return None
         
         try:
-            # Deserialize credentials
-            credentials = pickle.loads(self.accounts[account_name]['credentials'])
+            credentials = self._cached_credentials(account_name)
             
-            # Check if credentials need refreshing
-            if credentials.expired and credentials.refresh_token:
-                credentials.refresh(Request())
-                # Update stored credentials
-                self.accounts[account_name]['credentials'] = pickle.dumps(credentials)
-                self.save_accounts()
-                self.log(f"Refreshed credentials for {account_name}")
+            # Check if credentials need refreshing, the token request runs outside the lock
+            if self._refresh_credentials(credentials):
+                self._credentials_refreshed(account_name)
             
             return credentials
         except Exception as e:
             self.log(f"Error getting credentials: {str(e)}", "error")
             return None
     
+    def _cached_credentials(self, account_name):
+        """Deserialize an account's credentials once and reuse the live object afterwards"""
+        with self._lock:
+            credentials = self._cred_cache.get(account_name)
+            if credentials is None:
+                stored = self.accounts[account_name]['credentials']
+                if isinstance(stored, str):
+                    # Older files store credentials as base64 encoded pickles,
+                    # they are converted the first time the account is used
+                    credentials = self._migrate_credentials(account_name)
+                else:
+                    from google.oauth2.credentials import Credentials
+                    credentials = Credentials.from_authorized_user_info(stored, SCOPES)
+                self._cred_cache[account_name] = credentials
+            return credentials
+    
+    @staticmethod
+    def _refresh_credentials(credentials):
+        """Refresh expired credentials, returns True if a token request was made"""
+        if credentials.expired and credentials.refresh_token:
+            from google.auth.transport.requests import Request
+            credentials.refresh(Request())
+            return True
+        return False
+    
+    def _credentials_refreshed(self, account_name):
+        """Record that an account's cached credentials were refreshed, from any thread"""
+        # Stored credentials are updated from the cached object on the next save
+        with self._lock:
+            self._stale_credentials.add(account_name)
+            self._dirty = True
+        self.request_save()
+        self.log(f"Refreshed credentials for {account_name}")
+    
     def get_current_credentials(self):
         """Get credentials for current account"""
         return self.get_account_credentials(self.current_account)
@@ -262,6 +418,29 @@ class AccountManager:
             'title': account_info.get('channel_title', 'Unknown Channel')
         }
     
+    def _fetch_channel_info(self, credentials):
+        """Fetch (channel_id, channel_title) for credentials, None if the account has no channel"""
+        youtube = self._get_service(credentials)
+        response = youtube.channels().list(part="snippet", mine=True).execute()
+        
+        if not response.get('items'):
+            return None
+        return response['items'][0]['id'], response['items'][0]['snippet']['title']
+    
+    def _refresh_and_fetch_channel_info(self, credentials):
+        """Refresh expired credentials, then fetch their channel info"""
+        self._refresh_credentials(credentials)
+        return self._fetch_channel_info(credentials)
+    
+    def _update_channel_info(self, account_name, channel_id, channel_title):
+        """Store channel info for an account, marking state dirty only if it changed"""
+        account_info = self.accounts[account_name]
+        if (account_info.get('channel_id') != channel_id
+                or account_info.get('channel_title') != channel_title):
+            account_info['channel_id'] = channel_id
+            account_info['channel_title'] = channel_title
+            self._dirty = True
+    
     def refresh_channel_info(self, name=None):
         """Refresh channel info for an account"""
         account_name = name if name else self.current_account
@@ -274,16 +453,12 @@ class AccountManager:
             return False
         
         try:
-            youtube = build(API_SERVICE_NAME, API_VERSION, credentials=credentials)
-            response = youtube.channels().list(part="snippet", mine=True).execute()
+            channel_info = self._fetch_channel_info(credentials)
             
-            if response.get('items'):
-                channel_id = response['items'][0]['id']
-                channel_title = response['items'][0]['snippet']['title']
-                
-                self.accounts[account_name]['channel_id'] = channel_id
-                self.accounts[account_name]['channel_title'] = channel_title
-                self.save_accounts()
+            if channel_info:
+                channel_id, channel_title = channel_info
+                self._update_channel_info(account_name, channel_id, channel_title)
+                self.request_save()
                 self.log(f"Updated channel info for {account_name}: {channel_title}")
                 return True
             else:
@@ -292,6 +467,49 @@ class AccountManager:
         except Exception as e:
             self.log(f"Error refreshing channel info: {str(e)}", "error")
             return False
+    
+    def refresh_all_channel_info(self):
+        """Refresh channel info for every account concurrently, returns the number of accounts updated"""
+        # Only deserialize here, expired tokens are refreshed by the pool next to the fetch
+        credentials_by_name = {}
+        for account_name in list(self.accounts):
+            try:
+                credentials_by_name[account_name] = self._cached_credentials(account_name)
+            except Exception as e:
+                self.log(f"Error getting credentials: {str(e)}", "error")
+        
+        if not credentials_by_name:
+            return 0
+        
+        # A new token after the task means it was refreshed, even if the fetch then failed
+        tokens = {name: credentials.token for name, credentials in credentials_by_name.items()}
+        updated = 0
+        workers = min(CHANNEL_REFRESH_WORKERS, len(credentials_by_name))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._refresh_and_fetch_channel_info, credentials): account_name
+                for account_name, credentials in credentials_by_name.items()
+            }
+            for future in as_completed(futures):
+                account_name = futures[future]
+                # Shared state is only updated here, on the calling thread
+                if credentials_by_name[account_name].token != tokens[account_name]:
+                    self._credentials_refreshed(account_name)
+                try:
+                    channel_info = future.result()
+                except Exception as e:
+                    self.log(f"Error refreshing channel info for {account_name}: {str(e)}", "error")
+                    continue
+                
+                if channel_info:
+                    self._update_channel_info(account_name, *channel_info)
+                    updated += 1
+                else:
+                    self.log(f"No channel found for account {account_name}", "warning")
+        
+        self.request_save()
+        self.log(f"Updated channel info for {updated} of {len(credentials_by_name)} accounts")
+        return updated
 
 
 class AccountManagerDialog(QDialog):
@@ -305,6 +523,9 @@ class AccountManagerDialog(QDialog):
         parent=None):
         super().__init__(parent)
         self.account_manager = account_manager
+        # Account name of each list row, and the row of each account name
+        self.account_names = []
+        self.account_rows = {}
         self.setup_ui()
         
     def setup_ui(self):
@@ -318,6 +539,10 @@ class AccountManagerDialog(QDialog):
         accounts_layout = QVBoxLayout()
         
         self.account_list = QListWidget()
+        # Every row is a single line of text, so skip per-row size hint queries
+        self.account_list.setUniformItemSizes(True)
+        self.account_list.setLayoutMode(QListView.Batched)
+        self.account_list.setBatchSize(64)
         accounts_layout.addWidget(self.account_list)
                 
         # Account buttons
@@ -344,6 +569,11 @@ class AccountManagerDialog(QDialog):
         account_buttons_layout.addWidget(self.remove_account_btn)
         account_buttons_layout.addWidget(self.refresh_btn)
         
+        self.refresh_all_btn = QPushButton("Refresh All")
+        self.refresh_all_btn.clicked.connect(self.refresh_all_channel_info)
+        self.refresh_all_btn.setEnabled(False)
+        account_buttons_layout.addWidget(self.refresh_all_btn)
+        
         accounts_layout.addLayout(account_buttons_layout)
         accounts_group.setLayout(accounts_layout)
         main_layout.addWidget(accounts_group)
@@ -369,25 +599,41 @@ class AccountManagerDialog(QDialog):
             
     def refresh_account_list(self):
         """Refresh the accounts list widget"""
-        self.account_list.clear()
-        
-        for name in self.account_manager.get_accounts_list():
-            account_info = self.account_manager.accounts[name]
-            channel_title = account_info.get('channel_title', 'Unknown Channel')
-            display_text = f"{name} ({channel_title})"
-            
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.UserRole, name)  # Store actual account name
-            self.account_list.addItem(item)
+        current_account = self.account_manager.current_account
+        
+        # Names and labels come from the same pass, so rows line up with account_names
+        accounts = self.account_manager.accounts
+        self.account_names = list(accounts)
+        self.account_rows = {name: row for row, name in enumerate(self.account_names)}
+        labels = [
+            f"{name} ({accounts[name].get('channel_title', 'Unknown Channel')})"
+            for name in self.account_names
+        ]
+        
+        # Repopulate with repaints and signals suspended so the list redraws once
+        self.account_list.setUpdatesEnabled(False)
+        self.account_list.blockSignals(True)
+        try:
+            self.account_list.clear()
+            self.account_list.addItems(labels)
             
             # Select current account if there is one
-            if name == self.account_manager.current_account:
-                self.account_list.setCurrentRow(self.account_list.count() - 1)
+            if current_account in self.account_rows:
+                self.account_list.setCurrentRow(self.account_rows[current_account])
+        finally:
+            self.account_list.blockSignals(False)
+            self.account_list.setUpdatesEnabled(True)
+        
+        self.refresh_all_btn.setEnabled(bool(self.account_names))
         
         # Update channel info if current account exists
-        if self.account_manager.current_account:
+        if current_account:
             self.on_account_selected(self.account_list.currentItem())
     
+    def item_account_name(self, item):
+        """Get the actual account name of a list item"""
+        return self.account_names[self.account_list.row(item)]
+    
     def on_account_selected(self, item):
         """Handle account selection in the list"""
         if item is None:
@@ -397,7 +643,7 @@ class AccountManagerDialog(QDialog):
             self.refresh_btn.setEnabled(False)
             return
         
-        account_name = item.data(Qt.UserRole)  # Get actual account name
+        account_name = self.item_account_name(item)
         self.account_manager.select_account(account_name)
         
         self.rename_account_btn.setEnabled(True)
@@ -417,6 +663,20 @@ class AccountManagerDialog(QDialog):
         else:
             QMessageBox.warning(self, "Warning", "Failed to update channel information")
     
+    def refresh_all_channel_info(self):
+        """Refresh channel info for all accounts"""
+        total = len(self.account_manager.accounts)
+        if not total:
+            return
+        
+        updated = self.account_manager.refresh_all_channel_info()
+        self.refresh_account_list()
+        if updated == total:
+            QMessageBox.information(self, "Success", "Channel information updated successfully")
+        else:
+            QMessageBox.warning(self, "Warning", 
+                                f"Updated channel information for {updated} of {total} accounts")
+    
     def add_account(self):
         """Add a new Google account"""
         if not self.account_manager.client_secrets_file:
@@ -449,7 +709,7 @@ class AccountManagerDialog(QDialog):
         if not self.account_list.currentItem():
             return
             
-        old_name = self.account_list.currentItem().data(Qt.UserRole)
+        old_name = self.item_account_name(self.account_list.currentItem())
         new_name, ok = QInputDialog.getText(
             self, "Rename Account", 
             "Enter new account name:", 
@@ -467,7 +727,7 @@ class AccountManagerDialog(QDialog):
         if not self.account_list.currentItem():
             return
             
-        account_name = self.account_list.currentItem().data(Qt.UserRole)
+        account_name = self.item_account_name(self.account_list.currentItem())
         
         reply = QMessageBox.question(
             self, "Confirm Removal",
@@ -484,11 +744,13 @@ class AccountManagerDialog(QDialog):
     
     def accept(self):
         """Accept dialog and emit signal with selected account"""
-        if self.account_manager.current_account:
+        account_name = self.account_manager.current_account
+        if account_name:
             credentials = self.account_manager.get_current_credentials()
-            channel_title = self.account_manager.accounts[self.account_manager.current_account].get('channel_title', 'Unknown Channel')
             if credentials:
-                self.account_changed.emit(self.account_manager.current_account, credentials, channel_title)
+                self.account_manager.flush()
+                channel_title = self.account_manager.get_current_channel_info()['title']
+                self.account_changed.emit(account_name, credentials, channel_title)
                 super().accept()
             else:
                 QMessageBox.critical(self, "Error", "Could not get account credentials")
\ No newline at end of file
@@ -4,17 +4,18 @@ current_directory = os.path.dirname(os.path.abspath(sys.argv[0]))
 os.chdir(current_directory)
 
 import json
-import pandas as pd
 import log
+from datafile import DATA_FILE_FILTER, msgpack, read_rows, write_rows
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QTableWidget, QTableWidgetItem, 
+                             QHBoxLayout, QTableView, 
                              QPushButton, QProgressBar, QTextEdit, QLabel,
                              QFileDialog, QMessageBox, QDialog, QFormLayout,
                              QLineEdit, QComboBox, QDialogButtonBox, QHeaderView,
                              QSplitter, QFrame, QStyleFactory, QAbstractItemView,
                              QCheckBox, QDateTimeEdit)
-from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTimer, QDateTime, pyqtSlot, Q_ARG
-from PyQt5.QtGui import QPalette, QColor, QFont
+from PyQt5.QtCore import (QThread, pyqtSignal, Qt, QTimer, QDateTime, pyqtSlot, QMetaObject,
+                          QAbstractTableModel, QModelIndex)
+from PyQt5.QtGui import QPalette, QColor, QBrush, QFont, QTextCursor
 from accounts import AccountManager
 from worker import GenerationWorker
 from uploader import UploadThread
@@ -23,6 +24,103 @@ import datetime
 import traceback
 import logging
 import queue
+from functools import partial
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Preset and workflow files are parsed with orjson when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Rows generated/uploaded at the same time during a bulk run. Generation is
+# compute bound, uploads are network bound, so the next row starts generating
+# while the previous ones upload.
+MAX_PARALLEL_GENERATIONS = 1
+MAX_PARALLEL_UPLOADS = 4
+# Most recent errors listed in the bulk run summary, the rest are only logged
+SUMMARY_ERROR_COUNT = 5
+# Threads used to check every row's files before a bulk run starts
+VALIDATION_WORKERS = 8
+# Row status updates from a bulk run are applied to the table at most this often
+ROW_STATUS_INTERVAL_MS = 50
+
+# Large presets are scanned for the fields we use when ijson is installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+STREAM_PRESET_THRESHOLD = 8 << 10  # 8 KiB, below this a full parse is faster
+
+# Errors raised when a preset/workflow file cannot be read or is not valid JSON
+# (the json and orjson decode errors, and UnicodeDecodeError, are ValueErrors)
+PRESET_READ_ERRORS = (OSError, ValueError) + ((ijson.JSONError,) if ijson is not None else ())
+
+# Top-level preset keys read by the bulk generator
+REQUIRED_PRESET_KEYS = frozenset([
+    'api_key', 'thumbnail_prompt', 'images_prompt', 'disclaimer',
+    'intro_prompt', 'looping_prompt', 'outro_prompt', 'loop_length',
+    'audio_word_limit', 'thumbnail_count', 'thumbnail_word_limit',
+])
+PRESET_FIELDS = REQUIRED_PRESET_KEYS | {'variables'}
+# A workflow is usable if any of these nodes is present
+WORKFLOW_NODE_TITLES = frozenset(['prompt', 'width', 'height', 'KSampler'])
+
+# Parsed preset/workflow files, keyed by path and invalidated by mtime and size.
+# Files no table row refers to any more are dropped by _forget_unused_files.
+_preset_cache = {}
+# (kind, path) -> ((mtime, size), content validation result)
+_validation_cache = {}
+
+
+def _extract_fields(f, fields):
+    """Read only the given top-level keys of a JSON object, stopping once all are found"""
+    data = {}
+    for key, value in ijson.kvitems(f, '', use_float=True):
+        if key in fields:
+            data[key] = value
+            if len(data) == len(fields):
+                break
+    return data
+
+
+def _file_stamp(st):
+    """Change marker of a file from its stat result"""
+    return st.st_mtime_ns, st.st_size
+
+
+def _forget_unused_files(paths):
+    """Drop the cached parses and validation results of files not in paths"""
+    for path in _preset_cache.keys() - paths:
+        del _preset_cache[path]
+    for key in [key for key in _validation_cache if key[1] not in paths]:
+        del _validation_cache[key]
+
+
+def _load_preset(path, fields=None, st=None):
+    """Load a preset (or workflow) JSON file, reusing the parsed data while the file is unchanged
+    
+    When fields is given only those top-level keys are guaranteed to be present.
+    st can be passed in when the caller has already stat'ed the file.
+    """
+    if st is None:
+        st = os.stat(path)
+    cached = _preset_cache.get(path)
+    # A full parse can serve any request, a partial one only the same fields
+    if cached is not None and cached[0] == _file_stamp(st) and cached[1] in (None, fields):
+        return cached[2]
+    
+    with open(path, 'rb') as f:
+        if fields is not None and ijson is not None and st.st_size > STREAM_PRESET_THRESHOLD:
+            data = _extract_fields(f, fields)
+        else:
+            data = _json_loads(f.read())
+            fields = None
+    _preset_cache[path] = (_file_stamp(st), fields, data)
+    return data
 
 
 class BulkGenerationWorker(QThread):
@@ -32,101 +130,163 @@ class BulkGenerationWorker(QThread):
     finished = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
     row_status_update = pyqtSignal(int, str, str)  # row, status, progress
+    rows_reset = pyqtSignal(list)  # Status of every row at the start of a run
     
-    def __init__(self, generation_data, main_window):
+    def __init__(self, generation_data, main_window,
+                 max_parallel_generations=MAX_PARALLEL_GENERATIONS,
+                 max_parallel_uploads=MAX_PARALLEL_UPLOADS):
         super().__init__()
         self.generation_data = generation_data
+        self.total_items = len(generation_data)
         self.main_window = main_window
+        self.max_parallel_generations = max(1, max_parallel_generations)
+        self.max_parallel_uploads = max(1, max_parallel_uploads)
         self.is_cancelled = False
+        self.is_done = False
+        # Next row to start
         self.current_item_index = 0
-        self.current_generation_worker = None
+        # Rows in each stage of the pipeline
+        self.generating_items = set()
+        self.pending_uploads = deque()
+        self.uploading_items = set()
+        # row -> threads started for it, kept alive until the run ends
+        self.item_threads = {}
+        # row -> last reported progress, and their running sum for the overall progress bar
+        self.item_progress = {}
+        self.progress_sum = 0
+        self.overall_progress = -1
+        # Items whose success/failure has already been counted
+        self.handled_items = set()
+        # row -> last (status, progress) and operation sent, to drop repeated updates
+        self.row_states = {}
+        self.row_operations = {}
         
         # Track results
         self.successful_items = 0
         self.failed_items = 0
-        self.error_messages = []
+        self.error_messages = deque(maxlen=SUMMARY_ERROR_COUNT)
     
     def cancel(self):
         """Cancel the generation process"""
         self.is_cancelled = True
-        if self.current_generation_worker and self.current_generation_worker.isRunning():
-            # Cancel current generation worker if it has cancel method
-            if hasattr(self.current_generation_worker, 'cancel'):
-                self.current_generation_worker.cancel()
+        for index in self.generating_items:
+            worker = self.item_threads[index].get('generation')
+            # Uploads already in flight are left to finish
+            if worker is not None and worker.isRunning():
+                worker.cancel()
     
     def run(self):
-        """Main bulk generation process - processes items one by one"""
+        """Main bulk generation process - generates and uploads rows as a two stage pipeline"""
         try:
             self.operation_update.emit("Starting bulk generation...")
-            # Reset all row statuses and counters
-            for i in range(len(self.generation_data)):
-                self.row_status_update.emit(i, "Ready", "0")
+            # Reset all row statuses with a single signal, the table updates them at once
+            statuses = ["Ready" if item.get('preset') is not None else "Error (Validation)"
+                        for item in self.generation_data]
+            self.row_states = {i: (status, "0") for i, status in enumerate(statuses)}
+            self.rows_reset.emit(statuses)
+            
+            # Resolve each account's credentials once, refreshing them here keeps
+            # token requests off the GUI thread
+            account_manager = self.main_window.account_manager
+            credentials = {}
+            for item in self.generation_data:
+                if item.get('preset') is None:
+                    continue
+                account = item['account']
+                if account not in credentials:
+                    credentials[account] = account_manager.get_account_credentials(account)
+                item['credentials'] = credentials[account]
             
             self.successful_items = 0
             self.failed_items = 0
-            self.error_messages = []
+            self.error_messages = deque(maxlen=SUMMARY_ERROR_COUNT)
+            self.handled_items = set()
             
-            self.process_next_item()
+            # Items are driven from the main thread, where the item signals are delivered
+            self.schedule_next_item()
         except Exception as e:
             self.error_occurred.emit(f"Error during bulk generation: {str(e)}")
     
+    def schedule_next_item(self):
+        """Queue the next item without waiting on a timer"""
+        QMetaObject.invokeMethod(self, "process_next_item", Qt.QueuedConnection)
+    
+    @pyqtSlot()
     def process_next_item(self):
-        """Process the next item in the queue"""
+        """Fill the free generation/upload slots, and finish once all items are done"""
+        if self.is_done:
+            return
+        
         if self.is_cancelled:
-            self.finished.emit(f"Bulk generation cancelled by user. Completed: {self.successful_items}, Failed: {self.failed_items}")
+            # Generated videos that have not started uploading are dropped
+            while self.pending_uploads:
+                self.on_item_error(self.pending_uploads.popleft(), "Cancelled by user")
+            # Wait for the items in flight to wind down before reporting
+            if not self.generating_items and not self.uploading_items:
+                self.is_done = True
+                self.finished.emit(f"Bulk generation cancelled by user. Completed: {self.successful_items}, Failed: {self.failed_items}")
             return
         
-        if self.current_item_index >= len(self.generation_data):
+        while self.pending_uploads and len(self.uploading_items) < self.max_parallel_uploads:
+            index = self.pending_uploads.popleft()
+            self.uploading_items.add(index)
+            self.set_row_status(index, "Uploading", "0")
+            self.item_threads[index]['upload'].start()
+        
+        total_items = self.total_items
+        # Generation pauses while a full batch of videos is already waiting to upload,
+        # so finished videos don't pile up on disk when uploads are the bottleneck
+        while (self.current_item_index < total_items
+               and len(self.generating_items) < self.max_parallel_generations
+               and len(self.pending_uploads) < self.max_parallel_uploads):
+            index = self.current_item_index
+            self.current_item_index += 1
+            self.start_item(index)
+        
+        if (self.current_item_index >= total_items and not self.generating_items
+                and not self.pending_uploads and not self.uploading_items):
             # All items processed - provide summary
-            total_items = len(self.generation_data)
+            self.is_done = True
             summary = f"Bulk generation completed! Total: {total_items}, Successful: {self.successful_items}, Failed: {self.failed_items}"
             
             if self.failed_items > 0:
                 summary += f"\n\nFailed items:"
-                for i, error_msg in enumerate(self.error_messages[-5:], 1):  # Show last 5 errors
+                for i, error_msg in enumerate(self.error_messages, 1):  # Show last errors
                     summary += f"\n{i}. {error_msg}"
-                if len(self.error_messages) > 5:
-                    summary += f"\n... and {len(self.error_messages) - 5} more errors (see logs for details)"
+                # Every failure records exactly one error message
+                if self.failed_items > len(self.error_messages):
+                    summary += f"\n... and {self.failed_items - len(self.error_messages)} more errors (see logs for details)"
             
             self.progress_update.emit(100)
             self.finished.emit(summary)
-            return
-        
-        # Get current item
-        current_item = self.generation_data[self.current_item_index]
-        total_items = len(self.generation_data)
-        
-        # Update row status to validating
-        self.row_status_update.emit(self.current_item_index, "Validating", "0")
-        
-        # Validate current item
-        self.operation_update.emit(f"Validating item {self.current_item_index + 1}/{total_items}")
-        
-        if not self.validate_item(current_item):
-            self.row_status_update.emit(self.current_item_index, "Error (Validation)", "0")
-            error_msg = f"Item {self.current_item_index + 1}: Validation failed"
+    
+    def start_item(self, index):
+        """Start generation for a row validated by BulkGenerationApp.validate_items"""
+        current_item = self.generation_data[index]
+        total_items = self.total_items
+        
+        preset = current_item.get('preset')
+        if preset is None:
+            self.operation_update.emit(current_item.get('validation_error', "Validation failed"))
+            error_msg = f"Item {index + 1}: Validation failed"
             self.error_messages.append(error_msg)
             self.operation_update.emit(error_msg)
             self.failed_items += 1
             
             # Continue to next item instead of stopping
-            self.current_item_index += 1
-            QTimer.singleShot(100, self.process_next_item)
+            self.handled_items.add(index)
+            self.set_item_progress(index, 100)
             return
         
         # Update row status to processing
-        self.row_status_update.emit(self.current_item_index, "Processing", "0")
-        
-        # Update progress for validation
-        base_progress = int(self.current_item_index / total_items * 100)
-        self.progress_update.emit(base_progress)
+        self.set_row_status(index, "Processing", "0")
         
         # Start generation for current item
-        self.operation_update.emit(f"Starting generation for item {self.current_item_index + 1}/{total_items}")
+        self.operation_update.emit(f"Starting generation for item {index + 1}/{total_items}")
         
-        # Extract data from preset
-        with open(current_item['preset_path'], 'r') as f:
-            data = json.load(f)
+        # Extract data from the preset parsed during validation
+        data = preset
+        current_item['disclaimer'] = data['disclaimer']
         
         api_key = data['api_key']
         video_title = current_item['video_title']
@@ -158,104 +318,88 @@ class BulkGenerationWorker(QThread):
                 outro_prompt = outro_prompt.replace(keyword, value)
                 images_prompt = images_prompt.replace(keyword, value)
 
-        # Create GenerationWorker for this item (you'll modify the parameters)
-        self.current_generation_worker = self.worker = GenerationWorker(
-            api_key, video_title.replace(' ', '-'),
-            thumbnail_prompt, images_prompt,
-            intro_prompt, looping_prompt, outro_prompt,
-            loop_length, word_limit,
-            image_count, image_word_limit,
-            workflow_file, self.main_window.logger
-        )
+        # Create GenerationWorker for this item, with its own scratch folder
+        try:
+            worker = GenerationWorker(
+                api_key, current_item['video_slug'],
+                thumbnail_prompt, images_prompt,
+                intro_prompt, looping_prompt, outro_prompt,
+                loop_length, word_limit,
+                image_count, image_word_limit,
+                workflow_file, self.main_window.logger,
+                temp_folder=f"__temp__{index}",
+                output_dir=current_item['output_dir']
+            )
+        except Exception as e:
+            self.on_item_error(index, str(e))
+            return
         
-        # Connect signals
-        self.current_generation_worker.progress_update.connect(self.on_item_progress)
-        self.current_generation_worker.operation_update.connect(self.on_item_operation)
-        self.current_generation_worker.finished.connect(self.on_item_generation_finished)
-        self.current_generation_worker.error_occurred.connect(self.on_item_error)
+        # Connect signals, tagged with the row they belong to
+        worker.progress_update.connect(partial(self.on_item_progress, index))
+        worker.operation_update.connect(partial(self.on_item_operation, index))
+        worker.finished.connect(partial(self.on_item_generation_finished, index))
+        worker.error_occurred.connect(partial(self.on_item_error, index))
         
         # Start generation for this item
-        self.current_generation_worker.start()
+        self.item_threads[index] = {'generation': worker}
+        self.generating_items.add(index)
+        worker.start()
     
-    def validate_item(self, item):
-        """Validate a single item"""
-        preset_path = item['preset_path']
-        workflow_path = item['workflow_path']
-        account = item['account']
-        
-        # Check file existence
-        if not preset_path or not os.path.exists(preset_path):
-            self.operation_update.emit(f"Preset file not found: {preset_path}")
-            return False
-        
-        if not workflow_path or not os.path.exists(workflow_path):
-            self.operation_update.emit(f"Workflow file not found: {workflow_path}")
-            return False
-        
-        if not account:
-            self.operation_update.emit("Account name is required")
-            return False
-        
-        # Validate content
-        if not self.main_window.validate_preset_content(preset_path):
-            self.operation_update.emit(f"Invalid preset content: {preset_path}")
-            return False
-        
-        if not self.main_window.validate_workflow_content(workflow_path):
-            self.operation_update.emit(f"Invalid workflow content: {workflow_path}")
-            return False
-        
-        return True
+    def set_row_status(self, index, status, progress):
+        """Emit row_status_update unless the row already shows this status and progress"""
+        state = (status, progress)
+        if self.row_states.get(index) == state:
+            return
+        self.row_states[index] = state
+        self.row_status_update.emit(index, status, progress)
     
-    def on_item_progress(self, progress):
+    def set_item_progress(self, index, progress):
+        """Record a row's progress and report the overall progress"""
+        self.progress_sum += progress - self.item_progress.get(index, 0)
+        self.item_progress[index] = progress
+        overall_progress = min(self.progress_sum // self.total_items, 100)
+        if overall_progress != self.overall_progress:
+            self.overall_progress = overall_progress
+            self.progress_update.emit(overall_progress)
+    
+    def on_item_progress(self, index, progress):
         """Handle progress update from individual item generation"""
-        total_items = len(self.generation_data)
-        base_progress = int(self.current_item_index / total_items * 100)
-        item_progress = int(progress / total_items)
-        total_progress = min(base_progress + item_progress, 100)
-        self.progress_update.emit(total_progress)
+        self.set_item_progress(index, progress)
         
         # Update row progress
-        self.row_status_update.emit(self.current_item_index, "Processing", str(progress))
+        status = "Uploading" if index in self.uploading_items else "Processing"
+        self.set_row_status(index, status, str(progress))
     
-    def on_item_operation(self, operation):
+    def on_item_operation(self, index, operation):
         """Handle operation update from individual item generation"""
-        total_items = len(self.generation_data)
-        message = f"[{self.current_item_index + 1}/{total_items}] {operation}"
+        if self.row_operations.get(index) == operation:
+            return
+        self.row_operations[index] = operation
+        message = f"[{index + 1}/{self.total_items}] {operation}"
         self.operation_update.emit(message)
     
-    def on_item_generation_finished(self, description):
-        current_item = self.generation_data[self.current_item_index]
+    def on_item_generation_finished(self, index, description):
+        # GenerationWorker also emits finished after an error, which was already handled
+        if index in self.handled_items or self.is_cancelled:
+            if index not in self.handled_items:
+                self.on_item_error(index, "Cancelled by user")
+            return
         
-        with open(current_item['preset_path'], 'r') as f:
-            preset = json.load(f)
+        current_item = self.generation_data[index]
         
-        video_title = current_item['video_title']
-        video_path = os.path.join(title_to_safe_folder_name(video_title.replace(' ', '-')), "final_slideshow_with_audio.mp4")
-        thumbnail_path =os.path.join(title_to_safe_folder_name(video_title.replace(' ', '-')), "thumbnail.jpg")
-        title = video_title
+        video_path = current_item['video_path']
+        thumbnail_path = current_item['thumbnail_path']
+        title = current_item['video_title']
         category = current_item['category']
-        video_description = description + "\n\n" + preset['disclaimer']
+        video_description = description + "\n\n" + current_item['disclaimer']
         privacy_status = "public"
         made_for_kids = False
         
         if current_item['schedule'] == "":
             publish_at = None
         else : 
-            # Convert local datetime to UTC
-            import datetime
-            import pytz
-            
-            publish_at = datetime.datetime.fromisoformat(current_item['schedule'])
-            
-            # Get your local timezone
-            local_timezone = datetime.datetime.now(datetime.timezone.utc).astimezone().tzinfo
-            
-            # Make the datetime timezone-aware with your local timezone
-            aware_local_time = publish_at.replace(tzinfo=local_timezone)
-            
-            # Convert to UTC
-            publish_at = aware_local_time.astimezone(pytz.UTC)
+            # Convert local datetime to UTC (a naive datetime is taken as local time)
+            publish_at = datetime.datetime.fromisoformat(current_item['schedule']).astimezone(datetime.timezone.utc)
         
         # self.youtube_upload_progress_bar.setValue(0)
         # self.youtube_status_label.setText("Status: Preparing upload...")
@@ -263,7 +407,7 @@ class BulkGenerationWorker(QThread):
         # print(current_item)
         # print(safe_title(title))
         
-        self.upload_thread = UploadThread(
+        upload_thread = UploadThread(
             credentials=current_item['credentials'], 
             video_path=video_path, 
             title=title[:80], 
@@ -278,36 +422,43 @@ class BulkGenerationWorker(QThread):
         )
         
         # Connect signals
-        self.upload_thread.progress_signal.connect(self.on_item_progress)
-        self.upload_thread.finished_signal.connect(self.on_item_finished)
-        self.upload_thread.error_signal.connect(self.on_item_error)
-        
-        # Start the thread
-        self.upload_thread.start()
+        upload_thread.progress_signal.connect(partial(self.on_item_progress, index))
+        upload_thread.finished_signal.connect(partial(self.on_item_finished, index))
+        upload_thread.error_signal.connect(partial(self.on_item_error, index))
+        
+        # Queue the upload and let the next item start generating meanwhile
+        self.item_threads[index]['upload'] = upload_thread
+        self.generating_items.discard(index)
+        self.pending_uploads.append(index)
+        self.schedule_next_item()
     
-    def on_item_finished(self, url, video_id):
+    def on_item_finished(self, index, url, video_id):
         """Handle completion of individual item generation"""
-        total_items = len(self.generation_data)
-        self.operation_update.emit(f"✓ Completed item {self.current_item_index + 1}/{total_items}")
+        if index in self.handled_items:
+            return
+        self.handled_items.add(index)
+        
+        self.operation_update.emit(f"✓ Completed item {index + 1}/{self.total_items}")
         
         # Update row status to completed
-        self.row_status_update.emit(self.current_item_index, "Completed", url)
+        self.set_row_status(index, "Completed", url)
         self.successful_items += 1
         
-        # Move to next item
-        self.current_item_index += 1
-        self.current_generation_worker = None
-        
-        # Process next item
-        QTimer.singleShot(100, self.process_next_item)  # Small delay before next item
+        # Free the slot for the next item
+        self.uploading_items.discard(index)
+        self.set_item_progress(index, 100)
+        self.schedule_next_item()
     
-    def on_item_error(self, error_message):
+    def on_item_error(self, index, error_message):
         """Handle error from individual item generation - CONTINUE processing instead of stopping"""
-        total_items = len(self.generation_data)
-        error_msg = f"✗ Item {self.current_item_index + 1}/{total_items}: {error_message}"
+        if index in self.handled_items:
+            return
+        self.handled_items.add(index)
+        
+        error_msg = f"✗ Item {index + 1}/{self.total_items}: {error_message}"
         
         # Update row status to error
-        self.row_status_update.emit(self.current_item_index, "Error", "0")
+        self.set_row_status(index, "Error", "0")
         
         # Log the error but don't stop the entire process
         self.operation_update.emit(error_msg)
@@ -315,11 +466,10 @@ class BulkGenerationWorker(QThread):
         self.failed_items += 1
         
         # Continue to next item instead of stopping the entire process
-        self.current_item_index += 1
-        self.current_generation_worker = None
-        
-        # Process next item
-        QTimer.singleShot(100, self.process_next_item)  # Small delay before next item
+        self.generating_items.discard(index)
+        self.uploading_items.discard(index)
+        self.set_item_progress(index, 100)
+        self.schedule_next_item()
 
 
 class SettingsDialog(QDialog):
@@ -368,6 +518,8 @@ class SettingsDialog(QDialog):
         self.account_combo = QComboBox()
         self.account_combo.setEditable(False)
         self.account_combo.addItems(self.available_accounts)
+        # account name -> combo index
+        self.account_index = {name: i for i, name in enumerate(self.available_accounts)}
         
         self.category_id_edit = QLineEdit()
         self.category_id_edit.setPlaceholderText("Input the category id")
@@ -419,7 +571,7 @@ class SettingsDialog(QDialog):
         self.workflow_edit.setText(row_data.get('workflow_path', ''))
         self.video_title_edit.setText(row_data.get('video_title', ''))
         account = row_data.get('account', '')
-        index = self.account_combo.findText(account)
+        index = self.account_index.get(account, -1)
         if index >= 0:
             self.account_combo.setCurrentIndex(index)
         else:
@@ -437,17 +589,146 @@ class SettingsDialog(QDialog):
             'schedule': publish_at.strftime("%Y-%m-%dT%H:%M:%S") if self.schedule_checkbox.isChecked() else ""
         }
 
+# Settings table columns: header label and the row dict key shown in it
+TABLE_COLUMNS = [
+    ("Video Title", 'video_title'),
+    ("Preset File", 'preset_path'),
+    ("Workflow File", 'workflow_path'),
+    ("Account", 'account'),
+    ("Category", 'category'),
+    ("Scheduled Time", 'schedule'),
+    ("Status", 'status'),
+    ("Progress", 'progress'),
+    ("Video URL", 'video_url'),
+]
+COLUMN_KEYS = [key for _, key in TABLE_COLUMNS]
+
+# Cell backgrounds, shared by every row instead of built per cell
+GREEN = QBrush(QColor(40, 80, 40))  # Dark green
+RED = QBrush(QColor(80, 40, 40))  # Dark red
+ORANGE = QBrush(QColor(80, 60, 30))  # Dark yellow/orange
+TEAL = QBrush(QColor(30, 70, 80))  # Dark teal
+BLUE = QBrush(QColor(50, 50, 80))  # Dark blue
+# Status/progress background for each row status, others use the default
+STATUS_BRUSHES = {
+    "Completed": GREEN,
+    "Processing": ORANGE,
+    "Uploading": TEAL,
+    "Error": RED,
+    "Error (Validation)": RED,
+    "Validating": BLUE,
+}
+
+
+class BulkTableModel(QAbstractTableModel):
+    """Read-only table model over the list of row dicts used by the bulk generator"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        # Per row: column -> background colour, missing columns use the default
+        self.backgrounds = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(TABLE_COLUMNS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.rows[index.row()][COLUMN_KEYS[index.column()]]
+        if role == Qt.BackgroundRole:
+            return self.backgrounds[index.row()].get(index.column())
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return TABLE_COLUMNS[section][0]
+        return super().headerData(section, orientation, role)
+    
+    def append_row(self, data, backgrounds=None):
+        """Append a row dict"""
+        self.append_rows([data], [backgrounds or {}])
+    
+    def append_rows(self, rows, backgrounds):
+        """Append several row dicts, with their background colours, as one insertion"""
+        if not rows:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.rows.extend(rows)
+        self.backgrounds.extend(backgrounds)
+        self.endInsertRows()
+    
+    def remove_row(self, row):
+        """Remove a row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.rows[row]
+        del self.backgrounds[row]
+        self.endRemoveRows()
+    
+    def clear(self):
+        """Remove every row"""
+        self.beginResetModel()
+        self.rows = []
+        self.backgrounds = []
+        self.endResetModel()
+    
+    def update_row(self, row, values=None, backgrounds=None):
+        """Update some values and/or background colours (None resets to default) of a row"""
+        columns = self.apply_row_update(row, values, backgrounds)
+        if columns:
+            self.dataChanged.emit(self.index(row, min(columns)), self.index(row, max(columns)))
+    
+    def update_rows(self, values, backgrounds):
+        """Update the rows from the first one on, emitting a single dataChanged for all of them"""
+        columns = []
+        for row, (row_values, row_backgrounds) in enumerate(zip(values, backgrounds)):
+            columns.extend(self.apply_row_update(row, row_values, row_backgrounds))
+        if columns:
+            self.dataChanged.emit(self.index(0, min(columns)), self.index(len(values) - 1, max(columns)))
+    
+    def apply_row_update(self, row, values, backgrounds):
+        """Store a row update without notifying views, returning the changed columns"""
+        columns = []
+        if values:
+            self.rows[row].update(values)
+            columns.extend(COLUMN_KEYS.index(key) for key in values)
+        if backgrounds:
+            row_backgrounds = self.backgrounds[row]
+            for col, color in backgrounds.items():
+                if color is None:
+                    row_backgrounds.pop(col, None)
+                else:
+                    row_backgrounds[col] = color
+            columns.extend(backgrounds)
+        return columns
+
+
 class BulkGenerationApp(QMainWindow):
     """Main application window"""
+    # Emitted from any thread when the log queue goes from empty to non-empty
+    log_pending = pyqtSignal()
     
     def __init__(self):
         super().__init__()
         self.logger, _ = log.setup_logger()
         
         self.generation_worker = None
+        # Row data shown in settings_table
+        self.table_model = BulkTableModel(self)
+        # row -> latest (status, progress) from the bulk worker, not yet shown
+        self.pending_row_status = {}
+        self.row_status_timer = QTimer(self)
+        self.row_status_timer.setSingleShot(True)
+        self.row_status_timer.setInterval(ROW_STATUS_INTERVAL_MS)
+        self.row_status_timer.timeout.connect(self.flush_row_status)
         self.setup_ui()
         self.setup_connections()
-        self.setup_timer_based_logging()
+        self.setup_queue_logging()
         
     def setup_ui(self):
         self.setWindowTitle("Bulk Generation Manager")
@@ -490,9 +771,8 @@ class BulkGenerationApp(QMainWindow):
         layout.addWidget(title)
         
         # Table
-        self.settings_table = QTableWidget()
-        self.settings_table.setColumnCount(9)
-        self.settings_table.setHorizontalHeaderLabels(["Video Title", "Preset File", "Workflow File", "Account", "Category", "Scheduled Time", "Status", "Progress", "Video URL"])
+        self.settings_table = QTableView()
+        self.settings_table.setModel(self.table_model)
         
         # Make table fill the width
         header = self.settings_table.horizontalHeader()
@@ -590,24 +870,21 @@ class BulkGenerationApp(QMainWindow):
         # Table double-click to edit
         self.settings_table.doubleClicked.connect(self.edit_row)
     
-    def setup_timer_based_logging(self):
-        """Alternative approach using QTimer for even safer logging"""
-        from PyQt5.QtCore import QTimer
-        
-        # Create a timer to periodically check for log messages
-        self.log_timer = QTimer()
-        self.log_timer.timeout.connect(self.process_log_queue)
-        self.log_timer.start(100)  # Check every 100ms
-        
+    def setup_queue_logging(self):
+        """Queue log records and drain them on the main thread when signalled"""
         # Use a queue for log messages
-        import queue
         self.log_message_queue = queue.Queue()
+        # Queued even from the main thread, so bursts of records are drained together
+        self.log_pending.connect(self.process_log_queue, Qt.QueuedConnection)
         
         # Create custom handler that uses the queue
         class QueueLogHandler(logging.Handler):
-            def __init__(self, message_queue):
+            def __init__(self, message_queue, pending_signal):
                 super().__init__()
                 self.message_queue = message_queue
+                self.pending_signal = pending_signal
+                # Set while a drain is queued, so a burst of records costs one signal
+                self.notify_pending = False
                 formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
                 self.setFormatter(formatter)
             
@@ -617,64 +894,58 @@ class BulkGenerationApp(QMainWindow):
                     try:
                         self.message_queue.put_nowait(msg)
                     except queue.Full:
-                        pass  # Skip if queue is full
+                        return  # Skip if queue is full
+                    if not self.notify_pending:
+                        self.notify_pending = True
+                        self.pending_signal.emit()
                 except Exception:
                     pass
         
         # Add the queue handler to logger
-        self.queue_handler = QueueLogHandler(self.log_message_queue)
+        self.queue_handler = QueueLogHandler(self.log_message_queue, self.log_pending)
         self.logger.addHandler(self.queue_handler)
     
+    @pyqtSlot()
     def process_log_queue(self):
-        """Process log messages from queue (called by timer)"""
-        messages_processed = 0
-        max_messages_per_update = 10  # Limit to prevent UI blocking
-        
+        """Process log messages from queue (called through log_pending)"""
+        # Clear the flag first so records queued while draining signal again
+        self.queue_handler.notify_pending = False
+        messages = []
         try:
-            while messages_processed < max_messages_per_update:
+            while True:
                 try:
-                    message = self.log_message_queue.get_nowait()
-                    self.update_log(message)
-                    messages_processed += 1
+                    messages.append(self.log_message_queue.get_nowait())
                 except queue.Empty:
                     break
         except Exception:
             pass  # Ignore errors in log processing
-    def update_log(self, message):
-        """Thread-safe log update method"""
-        try:
-            # Make sure we're in the main thread
-            if QThread.currentThread() != QApplication.instance().thread():
-                # If not in main thread, use QMetaObject.invokeMethod for thread safety
-                from PyQt5.QtCore import QMetaObject, Qt
-                QMetaObject.invokeMethod(
-                    self, 
-                    "_update_log_ui", 
-                    Qt.QueuedConnection,
-                    Q_ARG(str, message)
-                )
-            else:
-                self._update_log_ui(message)
-        except Exception:
-            pass  # Ignore UI update errors
+        if messages:
+            self._append_log_messages(messages)
     
-    @pyqtSlot(str)
-    def _update_log_ui(self, message):
-        """Actually update the UI (must be called from main thread)"""
+    def _append_log_messages(self, messages):
+        """Append a batch of log lines with a single document edit (main thread only)"""
         try:
-            self.log_window.append(message)
+            scrollbar = self.log_window.verticalScrollBar()
+            at_bottom = scrollbar.value() >= scrollbar.maximum()
+            
+            document = self.log_window.document()
+            text = "\n".join(messages)
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text if document.isEmpty() else "\n" + text)
             
             # Limit the number of lines in log window to prevent memory issues
             max_lines = 1000
-            if self.log_window.document().lineCount() > max_lines:
-                cursor = self.log_window.textCursor()
-                cursor.movePosition(cursor.Start)
-                cursor.movePosition(cursor.Down, cursor.KeepAnchor, 100)  # Remove first 100 lines
+            excess = document.blockCount() - max_lines
+            if excess > 0:
+                cursor.movePosition(QTextCursor.Start)
+                # Remove at least 100 lines so trimming doesn't run on every batch
+                cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor, max(excess, 100))
                 cursor.removeSelectedText()
             
-            # Auto-scroll to bottom
-            scrollbar = self.log_window.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
+            # Auto-scroll to bottom, unless the user scrolled up to read
+            if at_bottom:
+                scrollbar.setValue(scrollbar.maximum())
             
         except Exception:
             pass  # Ignore UI errors
@@ -682,9 +953,9 @@ class BulkGenerationApp(QMainWindow):
     def closeEvent(self, event):
         """Clean up when closing the application"""
         try:
-            # Stop the timer if using timer-based logging
-            if hasattr(self, 'log_timer'):
-                self.log_timer.stop()
+            # Write any account changes that are still waiting to be saved
+            if hasattr(self, 'account_manager'):
+                self.account_manager.flush()
             
             # Clean up logging handlers
             if hasattr(self, 'logger'):
@@ -707,7 +978,7 @@ class BulkGenerationApp(QMainWindow):
     
     def edit_row(self):
         """Edit the selected row"""
-        current_row = self.settings_table.currentRow()
+        current_row = self.settings_table.currentIndex().row()
         if current_row < 0:
             QMessageBox.warning(self, "Warning", "Please select a row to edit.")
             return
@@ -729,7 +1000,7 @@ class BulkGenerationApp(QMainWindow):
     
     def delete_row(self):
         """Delete the selected row"""
-        current_row = self.settings_table.currentRow()
+        current_row = self.settings_table.currentIndex().row()
         if current_row < 0:
             QMessageBox.warning(self, "Warning", "Please select a row to delete.")
             return
@@ -738,311 +1009,401 @@ class BulkGenerationApp(QMainWindow):
                                    "Are you sure you want to delete this row?",
                                    QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            self.settings_table.removeRow(current_row)
+            self.table_model.remove_row(current_row)
+            self.forget_unused_files()
+    
+    def clear_rows(self):
+        """Remove every row from the table"""
+        self.table_model.clear()
+    
+    def forget_unused_files(self):
+        """Drop cached preset/workflow files that no row refers to any more"""
+        _forget_unused_files({data[key] for data in self.table_model.rows
+                              for key in ('preset_path', 'workflow_path')})
     
     def get_row_data(self, row):
         """Get data from a table row"""
-        return {
-            'video_title': self.settings_table.item(row,0).text() if self.settings_table.item(row, 0) else '',
-            'preset_path': self.settings_table.item(row, 1).text() if self.settings_table.item(row, 1) else '',
-            'workflow_path': self.settings_table.item(row, 2).text() if self.settings_table.item(row, 2) else '',
-            'account': self.settings_table.item(row, 3).text() if self.settings_table.item(row, 3) else '',
-            'category': self.settings_table.item(row, 4).text() if self.settings_table.item(row, 4) else '',
-            'schedule': self.settings_table.item(row, 5).text() if self.settings_table.item(row, 5) else '',
-            'status': self.settings_table.item(row, 6).text() if self.settings_table.item(row, 6) else 'Ready',
-            'progress': self.settings_table.item(row, 7).text() if self.settings_table.item(row, 7) else '0%'
-        }
+        return self.table_model.rows[row].copy()
     
     def add_table_row(self, data):
         """Add data to a new table row"""
-        row = self.settings_table.rowCount()
-        self.settings_table.insertRow(row)
-        self.update_table_row(row, data)
+        _, backgrounds = self.validate_row(data)
+        self.table_model.append_row(self.make_row(data), backgrounds)
+    
+    def bulk_add_rows(self, rows):
+        """Add many rows to the table with a single model insertion"""
+        # Rows sharing a preset or workflow check it only once, distinct files in parallel
+        checked_files = self.check_files(rows)
+        backgrounds = [self.validate_row(data, checked_files)[1] for data in rows]
+        self.begin_bulk_update()
+        try:
+            self.table_model.append_rows([self.make_row(data) for data in rows], backgrounds)
+        finally:
+            self.end_bulk_update()
     
     def update_table_row(self, row, data):
         """Update a table row with data"""
-        self.settings_table.setItem(row, 0, QTableWidgetItem(data['video_title']))
-        self.settings_table.setItem(row, 1, QTableWidgetItem(data['preset_path']))
-        self.settings_table.setItem(row, 2, QTableWidgetItem(data['workflow_path']))
-        self.settings_table.setItem(row, 3, QTableWidgetItem(data['account']))
-        self.settings_table.setItem(row, 4, QTableWidgetItem(data['category']))
-        self.settings_table.setItem(row, 5, QTableWidgetItem(data['schedule']))
-        
-        # Set status and progress if not provided
-        status = data.get('status', 'Ready')
-        progress = data.get('progress', '0%')
-        self.settings_table.setItem(row, 6, QTableWidgetItem(status))
-        self.settings_table.setItem(row, 7, QTableWidgetItem(progress))
-        self.settings_table.setItem(row, 8, QTableWidgetItem(""))
-        
-        # Make status and progress columns read-only
-        if self.settings_table.item(row, 6):
-            self.settings_table.item(row, 6).setFlags(self.settings_table.item(row, 6).flags() & ~Qt.ItemIsEditable)
-        if self.settings_table.item(row, 7):
-            self.settings_table.item(row, 7).setFlags(self.settings_table.item(row, 7).flags() & ~Qt.ItemIsEditable)
-        
-        # Color-code based on validation
-        self.validate_and_color_row(row, data)
-    
-    def validate_and_color_row(self, row, data):
-        """Validate row data and color-code accordingly"""
-        is_valid = True
-        
-        # Validate preset file
-        if not data['preset_path'] or not os.path.exists(data['preset_path']):
-            self.settings_table.item(row, 1).setBackground(QColor(80, 40, 40))  # Dark red
-            is_valid = False
-        else:
-            # Dummy content validation for preset
-            if not self.validate_preset_content(data['preset_path']):
-                self.settings_table.item(row, 1).setBackground(QColor(80, 60, 30))  # Dark yellow/orange
-                is_valid = False
-            else:
-                self.settings_table.item(row, 1).setBackground(QColor(40, 80, 40))  # Dark green
+        # Validate first so the values and colours change in one update
+        _, backgrounds = self.validate_row(data)
+        self.table_model.update_row(row, self.make_row(data), backgrounds)
+        self.forget_unused_files()
+    
+    def make_row(self, data):
+        """Build the row dict stored in the table model"""
+        return {
+            'video_title': data['video_title'],
+            'preset_path': data['preset_path'],
+            'workflow_path': data['workflow_path'],
+            'account': data['account'],
+            'category': data['category'],
+            'schedule': data['schedule'],
+            'status': data.get('status', 'Ready'),
+            'progress': data.get('progress', '0%'),
+            'video_url': ''
+        }
+    
+    def validate_row(self, data, checked_files=None):
+        """Validate row data, returning (is_valid, column -> background colour)
         
-        # Validate workflow file
-        if not data['workflow_path'] or not os.path.exists(data['workflow_path']):
-            self.settings_table.item(row, 2).setBackground(QColor(80, 40, 40))  # Dark red
-            is_valid = False
-        else:
-            # Dummy content validation for workflow
-            if not self.validate_workflow_content(data['workflow_path']):
-                self.settings_table.item(row, 2).setBackground(QColor(80, 60, 30))  # Dark yellow/orange
+        checked_files holds file states already found by check_files.
+        """
+        is_valid = True
+        backgrounds = {}
+        
+        # Validate preset and workflow files
+        for column, key, validate in self.file_columns():
+            file_path = data[key]
+            state = checked_files.get((column, file_path)) if checked_files else None
+            if state is None:
+                state = self.check_file(file_path, validate)
+            backgrounds[column] = state
+            if state is not GREEN:
                 is_valid = False
-            else:
-                self.settings_table.item(row, 2).setBackground(QColor(40, 80, 40))  # Dark green
         
         # Validate account
         if not data['account']:
-            self.settings_table.item(row, 3).setBackground(QColor(80, 40, 40))  # Dark red
+            backgrounds[3] = RED
             is_valid = False
         else:
-            self.settings_table.item(row, 3).setBackground(QColor(40, 80, 40))  # Dark green
+            backgrounds[3] = GREEN
         
-        return is_valid
+        return is_valid, backgrounds
+
+    def file_columns(self):
+        """Table column, row key and content validator of the preset and workflow files"""
+        return ((1, 'preset_path', self.validate_preset_content),
+                (2, 'workflow_path', self.validate_workflow_content))
+    
+    def check_file(self, file_path, validate):
+        """Background for a preset/workflow cell: red if missing, orange if invalid, green if valid
+        
+        Safe to call from any thread.
+        """
+        # Each file is stat'ed once, the validator reuses the result
+        try:
+            st = os.stat(file_path) if file_path else None
+        except OSError:
+            st = None
+        
+        if st is None:
+            return RED
+        return GREEN if validate(file_path, st) else ORANGE
+    
+    def check_files(self, rows):
+        """Check the distinct preset/workflow files of rows concurrently
+        
+        Returns (column, path) -> background for every file checked.
+        """
+        pending = {}
+        for data in rows:
+            for column, key, validate in self.file_columns():
+                pending.setdefault((column, data[key]), validate)
+        if not pending:
+            return {}
+        
+        workers = max(1, min(VALIDATION_WORKERS, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            states = executor.map(lambda item: self.check_file(item[0][1], item[1]), pending.items())
+            checked = dict(zip(pending, states))
+        return checked
 
+    def begin_bulk_update(self):
+        """Stop repainting the table while many rows are updated"""
+        self.settings_table.setUpdatesEnabled(False)
+    
+    def end_bulk_update(self):
+        """Resume repainting the table, redrawing it once"""
+        self.settings_table.setUpdatesEnabled(True)
+    
     def update_row_status(self, row, status, progress=None):
         """Update the status and progress of a specific row"""
-        if row < self.settings_table.rowCount():
-            # Update status
-            status_item = QTableWidgetItem(status)
-            status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-            self.settings_table.setItem(row, 6, status_item)
-            
-            # Color code based on status
-            if status == "Completed":
-                self.settings_table.item(row, 6).setBackground(QColor(40, 80, 40))  # Dark green
-                self.settings_table.item(row, 7).setBackground(QColor(40, 80, 40))  # Dark green
-                self.settings_table.item(row, 8).setText(progress)
-                progress = "100"
-                
-            elif status == "Processing":
-                self.settings_table.item(row, 6).setBackground(QColor(80, 60, 30))  # Dark yellow/orange
-                self.settings_table.item(row, 7).setBackground(QColor(80, 60, 30))  # Dark yellow/orange
-            elif status in ["Error", "Error (Validation)"]:
-                self.settings_table.item(row, 6).setBackground(QColor(80, 40, 40))  # Dark red
-                self.settings_table.item(row, 7).setBackground(QColor(80, 40, 40))  # Dark red
-            elif status == "Validating":
-                self.settings_table.item(row, 6).setBackground(QColor(50, 50, 80))  # Dark blue
-                self.settings_table.item(row, 7).setBackground(QColor(50, 50, 80))  # Dark blue
-            
-            # Update progress if provided
-            if progress is not None:
-                progress_text = f"{progress}%" if isinstance(progress, int) else str(progress)
-                progress_item = QTableWidgetItem(progress_text)
-                progress_item.setFlags(progress_item.flags() & ~Qt.ItemIsEditable)
-                self.settings_table.setItem(row, 7, progress_item)
-                
-    def validate_preset_content(self, file_path):
-        """Preset content validation"""
+        if row < len(self.table_model.rows):
+            self.table_model.update_row(row, *self.status_update(status, progress))
+    
+    def reset_row_statuses(self, statuses):
+        """Show the status every row starts a run with, as one model update"""
+        updates = [self.status_update(status, "0") for status in statuses[:len(self.table_model.rows)]]
+        self.table_model.update_rows([values for values, _ in updates],
+                                     [backgrounds for _, backgrounds in updates])
+    
+    def status_update(self, status, progress=None):
+        """Row values and status/progress backgrounds showing a status"""
+        values = {'status': status}
+        # Color code based on status
+        background = STATUS_BRUSHES.get(status)
+        
+        # A completed row reports its video URL in place of the progress
+        if status == "Completed":
+            values['video_url'] = progress
+            progress = "100"
+        
+        # Update progress if provided
+        if progress is not None:
+            values['progress'] = f"{progress}%" if isinstance(progress, int) else str(progress)
+        
+        return values, {6: background, 7: background}
+    
+    def queue_row_status(self, row, status, progress):
+        """Record a row status from the bulk worker, only the latest per row is applied"""
+        self.pending_row_status[row] = (status, progress)
+        if not self.row_status_timer.isActive():
+            self.row_status_timer.start()
+    
+    def flush_row_status(self):
+        """Apply the queued row statuses, repainting the table once"""
+        self.row_status_timer.stop()
+        if not self.pending_row_status:
+            return
+        pending, self.pending_row_status = self.pending_row_status, {}
+        self.begin_bulk_update()
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            if 'api_key' not in data:
-                return False
-            
-            if 'thumbnail_prompt' not in data:
-                return False
-            
-            if 'images_prompt' not in data:
-                return False
-            
-            if 'disclaimer' not in data:
-                return False
-            
-            if 'intro_prompt' not in data:
-                return False
-            
-            if 'looping_prompt' not in data:
-                return False
-            
-            if 'outro_prompt' not in data:
-                return False
-            
-            if 'loop_length' not in data:
-                return False
-            
-            if 'audio_word_limit' not in data:
-                return False
-            
-            if 'thumbnail_count' not in data:
-                return False
-            
-            if 'thumbnail_word_limit' not in data:
-                return False
-            
-            return True
-            # return isinstance(data, dict)
-        except:
-            return False
+            for row, (status, progress) in pending.items():
+                self.update_row_status(row, status, progress)
+        finally:
+            self.end_bulk_update()
     
-    def validate_workflow_content(self, file_path):
-        """Dummy workflow content validation - replace with actual logic"""
+    def load_item_file(self, file_path, fields, validator):
+        """Parse and check a preset/workflow file, returning (found, data or None if invalid)"""
+        # A missing file shows up as FileNotFoundError instead of costing a
+        # separate existence check
+        if not file_path:
+            return False, None
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                
-            prompt_exist = False
-            width_exist = False
-            height_exist = False
-            ksampler_exist = False
-            
-            for node_num, node in data.items():
-                if '_meta' not in node or 'title' not in node['_meta']:
-                    continue
-
-                if node['_meta']['title'] == 'prompt':
-                    prompt_exist = True
-                
-                if node['_meta']['title'] == 'width':
-                    width_exist = True
-
-                if node['_meta']['title'] == 'height':
-                    height_exist = True
-
-                if node['_meta']['title'] == 'KSampler':
-                    ksampler_exist = True
-            
-            return prompt_exist or width_exist or height_exist or ksampler_exist
+            data = _load_preset(file_path, fields)
+        except FileNotFoundError:
+            return False, None
+        except PRESET_READ_ERRORS:
+            return True, None
+        return True, data if validator(data) else None
+    
+    def validate_item(self, item, preset_result, workflow_result):
+        """Validate a single item from its files' load_item_file results,
+        returning (parsed preset, None) or (None, reason)"""
+        found, preset = preset_result
+        if not found:
+            return None, f"Preset file not found: {item['preset_path']}"
+        
+        found, workflow = workflow_result
+        if not found:
+            return None, f"Workflow file not found: {item['workflow_path']}"
+        
+        if not item['account']:
+            return None, "Account name is required"
+        
+        if preset is None:
+            return None, f"Invalid preset content: {item['preset_path']}"
         
-        except:
+        if workflow is None:
+            return None, f"Invalid workflow content: {item['workflow_path']}"
+        
+        return preset, None
+    
+    def validate_items(self, items):
+        """Validate all items, storing 'preset' or 'validation_error' on each"""
+        # Each distinct file is checked once, all of them concurrently
+        preset_paths = list({item['preset_path'] for item in items})
+        workflow_paths = list({item['workflow_path'] for item in items})
+        
+        workers = max(1, min(VALIDATION_WORKERS, len(preset_paths) + len(workflow_paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            preset_results = executor.map(
+                partial(self.load_item_file, fields=PRESET_FIELDS, validator=self.validate_preset_data),
+                preset_paths)
+            workflow_results = executor.map(
+                partial(self.load_item_file, fields=None, validator=self.validate_workflow_data),
+                workflow_paths)
+            presets = dict(zip(preset_paths, preset_results))
+            workflows = dict(zip(workflow_paths, workflow_results))
+        
+        for item in items:
+            preset, error = self.validate_item(
+                item, presets[item['preset_path']], workflows[item['workflow_path']])
+            item['preset'] = preset
+            if error:
+                item['validation_error'] = error
+    
+    def validate_file_content(self, kind, file_path, fields, validator, st=None):
+        """Validate a file's parsed content, remembering the result until the file changes"""
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return False
+        stamp = _file_stamp(st)
+        cached = _validation_cache.get((kind, file_path))
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        try:
+            data = _load_preset(file_path, fields, st)
+        except PRESET_READ_ERRORS:
+            data = None
+        valid = validator(data)
+        _validation_cache[(kind, file_path)] = (stamp, valid)
+        return valid
+    
+    def validate_preset_content(self, file_path, st=None):
+        """Preset content validation"""
+        return self.validate_file_content('preset', file_path, PRESET_FIELDS, self.validate_preset_data, st)
+    
+    def validate_preset_data(self, data):
+        """Validate an already parsed preset"""
+        return isinstance(data, dict) and REQUIRED_PRESET_KEYS <= data.keys()
+    
+    def validate_workflow_content(self, file_path, st=None):
+        """Dummy workflow content validation - replace with actual logic"""
+        return self.validate_file_content('workflow', file_path, None, self.validate_workflow_data, st)
+    
+    def validate_workflow_data(self, data):
+        """Validate an already parsed workflow"""
+        if not isinstance(data, dict):
             return False
+        
+        titles = set()
+        for node in data.values():
+            meta = node.get('_meta') if isinstance(node, dict) else None
+            if isinstance(meta, dict):
+                title = meta.get('title')
+                if isinstance(title, str):
+                    titles.add(title)
+        return not titles.isdisjoint(WORKFLOW_NODE_TITLES)
     
     def load_data(self):
-        """Load data from CSV or XLSX file"""
+        """Load data from CSV, XLSX or MessagePack file"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Load Data", "", "Excel Files (*.xlsx);;CSV Files (*.csv)")
+            self, "Load Data", "", DATA_FILE_FILTER)
         
         if not file_path:
             return
         
-        try:
-            if file_path.endswith('.xlsx'):
-                df = pd.read_excel(file_path)
-            else:
-                df = pd.read_csv(file_path)
+        # MessagePack files need the optional msgpack package
+        if os.path.splitext(file_path)[1].lower() == '.msgpack' and msgpack is None:
+            QMessageBox.critical(self, "Error", "MessagePack support requires the msgpack package.")
+            return
         
-            def safe_str(val):
-                return '' if pd.isna(val) else str(val)
+        try:
+            rows = read_rows(file_path)
             
             # Clear existing data
-            self.settings_table.setRowCount(0)
+            self.clear_rows()
             
             # Load data into table
-            for _, row in df.iterrows():
-                data =  {
-                    'video_title': safe_str(row.get('video_title')),
-                    'preset_path': safe_str(row.get('preset_path')),
-                    'workflow_path': safe_str(row.get('workflow_path')),
-                    'account': safe_str(row.get('account')),
-                    'category': safe_str(row.get('category')),
-                    'schedule': safe_str(row.get('schedule')),
-                    'status': 'Ready',
-                    'progress': '0%'
-                }
-                print(row.get('schedule', ''))
-                self.add_table_row(data)
+            self.bulk_add_rows(rows)
+            self.forget_unused_files()
             
-            self.logger.info(f"Successfully loaded {len(df)} rows from {file_path}")
+            self.logger.info(f"Successfully loaded {len(rows)} rows from {file_path}")
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load data: {str(e)}")
             
     def save_data(self):
-        """Save data to CSV or XLSX file"""
-        if self.settings_table.rowCount() == 0:
+        """Save data to CSV, XLSX or MessagePack file"""
+        if not self.table_model.rows:
             QMessageBox.warning(self, "Warning", "No data to save.")
             return
         
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Data", "", "Excel Files (*.xlsx);;CSV Files (*.csv)")
+            self, "Save Data", "", DATA_FILE_FILTER)
         
         if not file_path:
             return
         
+        # MessagePack files need the optional msgpack package
+        if os.path.splitext(file_path)[1].lower() == '.msgpack' and msgpack is None:
+            QMessageBox.critical(self, "Error", "MessagePack support requires the msgpack package.")
+            return
+        
         try:
-            data = []
-            for row in range(self.settings_table.rowCount()):
-                row_data = self.get_row_data(row)
-                # Only save the core data, not status/progress
-                data.append({
-                    'video_title': row_data['video_title'],
-                    'preset_path': row_data['preset_path'],
-                    'workflow_path': row_data['workflow_path'],
-                    'account': row_data['account'],
-                    'category': row_data['category'],
-                    'schedule': row_data['schedule'],
-                })
+            rows = self.table_model.rows
+            write_rows(file_path, rows)
             
-            df = pd.DataFrame(data)
-            
-            if file_path.endswith('.xlsx'):
-                df.to_excel(file_path, index=False)
-            else:
-                df.to_csv(file_path, index=False)
-            
-            self.logger.info(f"Successfully saved {len(data)} rows to {file_path}")
+            self.logger.info(f"Successfully saved {len(rows)} rows to {file_path}")
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save data: {str(e)}")
     
     def start_generation(self):
         """Start the bulk generation process"""
-        if self.settings_table.rowCount() == 0:
+        if not self.table_model.rows:
             QMessageBox.warning(self, "Warning", "No data to generate.")
             return
         
-        # Collect all row data (validation will be done per item in the worker)
+        # Collect all row data, credentials are resolved by the worker thread
         generation_data = []
-        for row in range(self.settings_table.rowCount()):
-            data = self.get_row_data(row)
-            data['credentials'] = self.account_manager.get_account_credentials(data['account'])
+        output_dirs = set()
+        for index, row_data in enumerate(self.table_model.rows):
+            data = row_data.copy()
+            self.add_output_paths(data, index, output_dirs)
             generation_data.append(data)
         
         if not generation_data:
             QMessageBox.warning(self, "Warning", "No data to generate.")
             return
         
+        # Check every row's files up front so the run itself only generates and uploads
+        self.validate_items(generation_data)
+        
         # Start bulk generation
         self.start_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
+        # Status/progress cells repaint constantly during a run, skip the alternate row brush
+        self.settings_table.setAlternatingRowColors(False)
         
         self.bulk_generation_worker = BulkGenerationWorker(generation_data, self)
         self.bulk_generation_worker.progress_update.connect(self.update_progress)
         self.bulk_generation_worker.operation_update.connect(self.update_status)
         self.bulk_generation_worker.finished.connect(self.generation_finished)
         self.bulk_generation_worker.error_occurred.connect(self.generation_error)
-        self.bulk_generation_worker.row_status_update.connect(self.update_row_status)
+        self.bulk_generation_worker.row_status_update.connect(self.queue_row_status)
+        self.bulk_generation_worker.rows_reset.connect(self.reset_row_statuses)
         
         self.bulk_generation_worker.start()
         self.logger.info(f"Started bulk generation for {len(generation_data)} items")
     
+    def add_output_paths(self, data, index, output_dirs):
+        """Derive the folder name and output files of a row once, before the run starts
+        
+        Rows generate while earlier rows still upload, so a row whose title maps to a
+        folder in output_dirs gets its row number appended instead of sharing the files.
+        Folders are compared case-insensitively, as on Windows.
+        """
+        data['video_slug'] = data['video_title'].replace(' ', '-')
+        output_dir = title_to_safe_folder_name(data['video_slug'])
+        if output_dir.lower() in output_dirs:
+            output_dir = f"{output_dir}-{index + 1}"
+            while output_dir.lower() in output_dirs:
+                output_dir += "_"
+        output_dirs.add(output_dir.lower())
+        data['output_dir'] = output_dir
+        data['video_path'] = os.path.join(output_dir, "final_slideshow_with_audio.mp4")
+        data['thumbnail_path'] = os.path.join(output_dir, "thumbnail.jpg")
+    
     def cancel_generation(self):
         """Cancel the ongoing generation"""
-        if hasattr(self, 'bulk_generation_worker') and self.bulk_generation_worker and self.bulk_generation_worker.isRunning():
+        # The worker's run() returns once the first item is queued, so don't rely on isRunning()
+        if getattr(self, 'bulk_generation_worker', None) is not None:
             self.bulk_generation_worker.cancel()
             self.logger.info("Cancellation requested...")
     
@@ -1070,9 +1431,13 @@ class BulkGenerationApp(QMainWindow):
     
     def reset_generation_ui(self):
         """Reset UI after generation completion/cancellation"""
+        self.flush_row_status()
         self.start_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
+        self.settings_table.setAlternatingRowColors(True)
+        # Credentials refreshed by the worker thread are saved from here
+        self.account_manager.request_save()
         if hasattr(self, 'bulk_generation_worker'):
             self.bulk_generation_worker = None
 
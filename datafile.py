@@ -0,0 +1,97 @@
+import csv
+import importlib.util
+import os
+import pandas as pd
+
+# Columns stored in saved data files
+DATA_COLUMNS = ['video_title', 'preset_path', 'workflow_path', 'account', 'category', 'schedule']
+
+# Row lists can also be saved in a compact binary format when msgpack is installed
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+DATA_FILE_FILTER = "Excel Files (*.xlsx);;CSV Files (*.csv)"
+if msgpack is not None:
+    DATA_FILE_FILTER += ";;MessagePack Files (*.msgpack)"
+
+# Excel files are written row by row with bounded memory when xlsxwriter is installed
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# Faster readers for data files, used when installed
+try:
+    import pyarrow
+    import pyarrow.csv
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    pyarrow = None
+    CSV_ENGINE = None
+# pandas imports calamine itself, only check that it is installed
+EXCEL_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') is not None else None
+
+
+def read_rows(file_path):
+    """Read the rows of a CSV, XLSX or MessagePack file as dicts of DATA_COLUMNS strings"""
+    extension = os.path.splitext(file_path)[1].lower()
+
+    if extension == '.msgpack':
+        with open(file_path, 'rb') as f:
+            return [
+                {key: '' if row.get(key) is None else str(row.get(key)) for key in DATA_COLUMNS}
+                for row in msgpack.unpackb(f.read(), raw=False)
+            ]
+
+    # Only the saved columns are parsed, as text so no types are inferred
+    wanted = DATA_COLUMNS.__contains__
+    if extension == '.xlsx':
+        df = pd.read_excel(file_path, engine=EXCEL_ENGINE, usecols=wanted, dtype=str)
+    elif CSV_ENGINE == 'pyarrow':
+        # pandas' pyarrow engine infers types before applying dtype, so
+        # the columns are declared as strings to pyarrow itself
+        convert_options = pyarrow.csv.ConvertOptions(
+            column_types={key: pyarrow.string() for key in DATA_COLUMNS},
+            include_columns=DATA_COLUMNS,
+            include_missing_columns=True)
+        df = pyarrow.csv.read_csv(file_path, convert_options=convert_options).to_pandas()
+    else:
+        df = pd.read_csv(file_path, usecols=wanted, dtype=str)
+    # Convert whole columns at once instead of boxing every row,
+    # columns missing from the file are added empty
+    df = df.reindex(columns=DATA_COLUMNS).fillna('')
+    return df.to_dict('records')
+
+
+def write_rows(file_path, rows):
+    """Write the DATA_COLUMNS of row dicts to a CSV, XLSX or MessagePack file"""
+    extension = os.path.splitext(file_path)[1].lower()
+
+    if extension == '.msgpack':
+        # Only save the core data, not status/progress
+        data = [{key: row_data[key] for key in DATA_COLUMNS} for row_data in rows]
+        with open(file_path, 'wb') as f:
+            f.write(msgpack.packb(data, use_bin_type=True))
+    elif extension == '.xlsx' and xlsxwriter is not None:
+        # constant_memory only keeps the current row, so rows are written
+        # strictly in order; cells are stored as text like the other formats
+        with xlsxwriter.Workbook(file_path, {'constant_memory': True,
+                                             'strings_to_formulas': False,
+                                             'strings_to_urls': False}) as workbook:
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, DATA_COLUMNS)
+            for index, row_data in enumerate(rows, 1):
+                worksheet.write_row(index, 0, [row_data[key] for key in DATA_COLUMNS])
+    elif extension == '.xlsx':
+        # The rows already are dicts, the frame picks the core columns
+        df = pd.DataFrame(rows, columns=DATA_COLUMNS)
+        df.to_excel(file_path, index=False)
+    else:
+        # Written straight from the row dicts, quoted and line-terminated
+        # the same way pandas.to_csv writes them
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, DATA_COLUMNS, extrasaction='ignore',
+                                    lineterminator=os.linesep)
+            writer.writeheader()
+            writer.writerows(rows)
@@ -317,6 +317,10 @@ class VideoGeneratorApp(QMainWindow):
             if hasattr(self, 'log_timer'):
                 self.log_timer.stop()
             
+            # Write any account changes that are still waiting to be saved
+            if hasattr(self, 'account_manager'):
+                self.account_manager.flush()
+            
             # Clean up logging handlers
             if hasattr(self, 'logger'):
                 handlers = self.logger.handlers[:]
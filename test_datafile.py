@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("pandas")
+import datafile
+
+
+@pytest.mark.parametrize("engine", [None, "pyarrow"])
+def test_csv_round_trip_keeps_text(tmp_path, monkeypatch, engine):
+    """Values that look like numbers or dates load back exactly as saved"""
+    if engine == "pyarrow" and datafile.pyarrow is None:
+        pytest.skip("pyarrow is not installed")
+    monkeypatch.setattr(datafile, "CSV_ENGINE", engine)
+
+    rows = [{
+        'video_title': "007",
+        'preset_path': "presets/a.json",
+        'workflow_path': "",
+        'account': "main",
+        'category': "022",
+        'schedule': "2025-01-02T03:04:05",
+        'status': "Ready",
+    }]
+    file_path = str(tmp_path / "rows.csv")
+    datafile.write_rows(file_path, rows)
+
+    expected = {key: rows[0][key] for key in datafile.DATA_COLUMNS}
+    assert datafile.read_rows(file_path) == [expected]
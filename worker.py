@@ -21,7 +21,8 @@ class GenerationWorker(QThread):
                  intro_prompt, looping_prompt, outro_prompt,
                  loop_length, word_limit, image_count, image_word_limit,
                  workflow_file, 
-                 logger: Logger):
+                 logger: Logger,
+                 temp_folder="__temp__", output_dir=None):
         super().__init__()
         self.api_key = api_key
         self.video_title = video_title
@@ -35,7 +36,12 @@ class GenerationWorker(QThread):
         self.image_count = image_count
         self.image_word_limit = image_word_limit
         self.logger = logger
+        self.temp_folder = temp_folder  # Must be unique when several workers run at once
+        # Defaults to a folder named after the title
+        self.output_dir = output_dir or title_to_safe_folder_name(video_title)
         self._is_cancelled = False
+        # Last progress sent, repeated values are not emitted again
+        self.last_progress = -1
         
         # Runtime tracking
         self.start_time = None
@@ -52,6 +58,12 @@ class GenerationWorker(QThread):
             self.logger.error(f"Failed to load workflow file: {e}")
             raise
 
+    def report_progress(self, progress):
+        """Emit progress_update only when the percentage changes"""
+        if progress != self.last_progress:
+            self.last_progress = progress
+            self.progress_update.emit(progress)
+
     def cancel(self):
         """Allow cancellation of the worker thread"""
         self._is_cancelled = True
@@ -211,7 +223,7 @@ class GenerationWorker(QThread):
             with self.audio_progress_lock:
                 self.completed_audio_count += 1
                 progress = int(45 + (self.completed_audio_count / self.total_audio_chunks) * 20)
-                self.progress_update.emit(progress)
+                self.report_progress(progress)
             
             self.logger.info(f"🎵 Generated audio {idx + 1} for chunk (parallel)")
             
@@ -326,7 +338,7 @@ class GenerationWorker(QThread):
         self.start_time = time.time()
         self.logger.info(f"🚀 Starting video generation at {time.strftime('%Y-%m-%d %H:%M:%S')}")
         
-        temp_folder_path = "__temp__"
+        temp_folder_path = self.temp_folder
         output_dir = None
         
         try:
@@ -334,7 +346,7 @@ class GenerationWorker(QThread):
             step_start = time.time()
             self.logger.info(f"Step 1/6: Initializing")
             self.operation_update.emit("Initializing")
-            output_dir = create_output_directory(title_to_safe_folder_name(self.video_title))
+            output_dir = create_output_directory(self.output_dir)
 
             # Check if folder exists
             if not os.path.exists(temp_folder_path):
@@ -345,7 +357,7 @@ class GenerationWorker(QThread):
 
             # Initialize OpenAI helper
             openai_helper = OpenAIHelper(self.api_key)
-            self.progress_update.emit(5)
+            self.report_progress(5)
             self._log_step_time("Initialization", step_start)
 
             # 2. Generating the scripts
@@ -365,7 +377,7 @@ class GenerationWorker(QThread):
                     raise Exception(f"Failed to generate intro script: {prev_id}")
                     
                 self.logger.info(f"Intro script generated successfully!")
-                self.progress_update.emit(6)
+                self.report_progress(6)
                 
             except Exception as e:
                 self.logger.error(f"Failed to generate intro script: {e}")
@@ -389,7 +401,7 @@ class GenerationWorker(QThread):
                         
                     looping_script += script + '\n\n'
                     self.logger.info(f"Looping script({idx}/{self.loop_length}) generated successfully!")
-                    self.progress_update.emit(int(6 + idx / self.loop_length * 3))
+                    self.report_progress(int(6 + idx / self.loop_length * 3))
                     
                     # Small delay to prevent overwhelming the API
                     time.sleep(0.5)
@@ -411,7 +423,7 @@ class GenerationWorker(QThread):
                     raise Exception(f"Failed to generate outro script: {prev_id}")
                     
                 self.logger.info(f"Outro script generated successfully!")
-                self.progress_update.emit(10)
+                self.report_progress(10)
                 
             except Exception as e:
                 self.logger.error(f"Failed to generate outro script: {e}")
@@ -460,7 +472,7 @@ class GenerationWorker(QThread):
                     f.write(base64.b64decode(image_data))
 
                 self.logger.info(f"Thumbnail image generated successfully!")
-                self.progress_update.emit(25)
+                self.report_progress(25)
                 
                 # Clear image data from memory
                 del image_data
@@ -517,7 +529,7 @@ class GenerationWorker(QThread):
                         f.write(base64.b64decode(image_data))
                     
                     progress = 25 + ((idx + 1) / len(image_chunks) * 20)
-                    self.progress_update.emit(int(progress))
+                    self.report_progress(int(progress))
                     self.logger.info(f"Generated image {idx + 1}/{len(image_chunks)}!")
                     
                     # Clear image data and force garbage collection
@@ -608,7 +620,7 @@ class GenerationWorker(QThread):
             self.logger.info(f"⏱ Total audio duration: {audio_duration:.2f}s")
 
             particle_loops = math.ceil(audio_duration / particle_duration)
-            self.progress_update.emit(65)
+            self.report_progress(65)
 
             # === Parameters ===
             output_video = 'final_slideshow_with_audio.mp4'
@@ -678,7 +690,7 @@ class GenerationWorker(QThread):
 
                         zoom_clips[-1] = os.path.abspath(extended_particle_effect)
 
-                    self.progress_update.emit(int(65 + idx / num_images * 25))
+                    self.report_progress(int(65 + idx / num_images * 25))
                     
                 except Exception as e:
                     self.logger.error(f"Failed to create video clip {idx}: {e}")
@@ -715,7 +727,7 @@ class GenerationWorker(QThread):
             self._safe_subprocess_run(cmd_final, timeout=600)
 
             self.logger.info("✅ Final video with audio created successfully!")
-            self.progress_update.emit(100)
+            self.report_progress(100)
             self._log_step_time("Video Assembly", step_start)
 
             # Log comprehensive runtime summary